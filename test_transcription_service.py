@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+
+import transcription_service
+from transcription_service import combine_chunk_results
+
+
+def segment(start, end, text):
+    return {"timestamp": [start, end], "text": text}
+
+
+def test_overlap_keeps_words_split_differently_by_both_chunks():
+    chunk_results = [
+        {"chunks": [segment(0, 5, "a"), segment(601, 605, "bonjour")]},
+        {"chunks": [segment(0, 4, "bonjour"), segment(10, 12, "b")]},
+    ]
+
+    result = combine_chunk_results(chunk_results)
+
+    assert result["text"] == "a bonjour b"
+    assert [chunk_data["timestamp"] for chunk_data in result["chunks"]] == [
+        [0, 5],
+        [600, 604],
+        [610, 612],
+    ]
+
+
+def test_overlap_does_not_repeat_words_heard_by_both_chunks():
+    chunk_results = [
+        {"chunks": [segment(0, 5, "a"), segment(595, 605, "x y")]},
+        {"chunks": [segment(0, 12, "y z"), segment(20, 22, "b")]},
+    ]
+
+    result = combine_chunk_results(chunk_results)
+
+    assert result["text"] == "a x y z b"
+
+
+def test_overlap_without_matching_words_cuts_at_a_segment_boundary():
+    chunk_results = [
+        {"chunks": [segment(598, 601, "un"), segment(601, 604, "deux")]},
+        {"chunks": [segment(0, 2, "ux"), segment(2, 6, "trois")]},
+    ]
+
+    result = combine_chunk_results(chunk_results)
+
+    assert result["text"] == "un deux trois"
+
+
+def test_partial_results_hold_back_the_unmerged_overlap(monkeypatch):
+    chunk_results = [
+        {"text": "a x y", "chunks": [segment(0, 5, "a"), segment(595, 605, "x y")]},
+        {"text": "y z b", "chunks": [segment(0, 12, "y z"), segment(20, 22, "b")]},
+    ]
+    chunks = [np.full(1, index, dtype=np.int16) for index in range(len(chunk_results))]
+    monkeypatch.setattr(transcription_service, "split_audio", lambda path: iter(chunks))
+
+    def transcribe_chunk(chunk):
+        # The second chunk completes last so a partial result is yielded first
+        time.sleep(0.1 * int(chunk[0]))
+        return chunk_results[int(chunk[0])]
+
+    monkeypatch.setattr(transcription_service, "transcribe_chunk", transcribe_chunk)
+    monkeypatch.setattr(transcription_service.os, "stat", lambda path: None)
+    monkeypatch.setenv("TRANSCRIBE_CONCURRENCY", "1")
+
+    results = list(transcription_service.transcript("audio.mp3"))
+
+    assert results[0]["text"] == "a"
+    assert results[-1]["text"] == "a x y z b"
+    for partial, following in zip(results, results[1:]):
+        assert following["chunks"][: len(partial["chunks"])] == partial["chunks"]
+        assert following["text"].startswith(partial["text"])
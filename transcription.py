@@ -6,12 +6,11 @@ from transcription_service import transcript
 
 def transcribe_audio_dinum(audio_file):
     try:
-        result = transcript(audio_file)
-        if result.get("text"):
-            return result.get("text")
-        return result
+        # Stream partial transcriptions to the UI as chunks complete
+        for result in transcript(audio_file):
+            yield result.get("text", "")
     except Exception as e:
-        return f"Error: {str(e)}"    
+        yield f"Error: {str(e)}"    
 
 
 def transcribe_audio_openai(audio_file):
@@ -1,62 +1,367 @@
 
-import mimetypes
+import bisect
+import gzip
+import hashlib
+import io
 import os
-import tempfile
-from typing import Dict, List
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from difflib import SequenceMatcher
+from itertools import takewhile
+from typing import Dict, Iterator, List, Optional, Tuple
 
+import av
+import numpy as np
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydub import AudioSegment
+from pydub.silence import detect_nonsilent
 
 CHUNK_DURATION_MINUTES = 10
 
-def get_mime_type(file_path: str) -> str:
+# Consecutive chunks overlap so that speech cut at a chunk boundary is heard in
+# full by one of them; duplicated segments are dropped when merging results
+CHUNK_OVERLAP_MS = 5000
+
+# Words matched in the overlap of two chunks must be heard by both within
+# this many seconds of each other
+OVERLAP_MATCH_TOLERANCE_SECONDS = 1.0
+
+# Chunks are kept as 16 kHz mono int16 samples, the format Whisper works on
+SAMPLE_RATE = 16000
+DEFAULT_TRANSCRIBE_CONCURRENCY = 5
+
+# Silence stripping: pauses longer than MIN_SILENCE_LEN_MS and quieter than
+# the chunk loudness minus SILENCE_THRESHOLD_DB are replaced by a fixed gap
+MIN_SILENCE_LEN_MS = 700
+SILENCE_THRESHOLD_DB = 16
+SILENCE_SEEK_STEP_MS = 10
+SILENCE_PADDING_MS = 500
+
+# Transcription cache: results are stored in TRANSCRIPTION_CACHE_DIR (caching
+# is disabled when unset), keyed by a hash of the uploaded audio and request
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+
+class _JitteredRetry(Retry):
     """
-    Guess the MIME type based on the file extension.
-    Args:
-        file_path (str): The path to the file for which to guess the MIME type.
-    Returns:
-        str: The guessed MIME type of the file.
-    Raises:
-        ValueError: If the MIME type cannot be determined or is unsupported.
-        FileNotFoundError: If the file does not exist.
+    Retry policy waiting backoff_factor * 2 ** (n - 1) seconds plus up to
+    backoff_jitter seconds of random jitter before the n-th retry, capped at
+    backoff_max. Unlike urllib3's default, the first retry is delayed and
+    jittered too, so parallel chunks failing together do not retry together.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
 
-    mime_type, _ = mimetypes.guess_type(file_path)
-    if mime_type is None:
-        raise ValueError(f"Unsupported file type: {file_path}")
+    def get_backoff_time(self) -> float:
+        consecutive_errors = len(
+            list(
+                takewhile(
+                    lambda history: history.redirect_location is None,
+                    reversed(self.history),
+                )
+            )
+        )
+        if consecutive_errors == 0:
+            return 0
+
+        backoff = self.backoff_factor * 2 ** (consecutive_errors - 1)
+        backoff += random.uniform(0, self.backoff_jitter)
+        return min(self.backoff_max, backoff)
+
+
+# Shared HTTP session so chunk uploads reuse pooled keep-alive connections
+# across chunks and across successive transcriptions. Transcription requests
+# have no side effects, so POSTs are retried on transient failures too: up to
+# 5 attempts, waiting about 1, 2, 4 then 8 seconds plus up to 1 second of
+# jitter, capped at 30 seconds; Retry-After is honoured on rate limiting.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=_JitteredRetry(
+            total=4,
+            backoff_factor=1,
+            backoff_max=30,
+            backoff_jitter=1,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None,
+            raise_on_status=False,
+        ),
+    ),
+)
+_session.mount("http://", _session.get_adapter("https://"))
 
-    return mime_type
+# Set once the API answers 415 to a gzip-encoded upload, so later uploads
+# are sent uncompressed straight away
+_gzip_upload_rejected = False
 
 
 def split_audio(
-    audio_path: str, chunk_length_ms: int = CHUNK_DURATION_MINUTES * 60 * 1000
-) -> List[AudioSegment]:
+    audio_path: str,
+    chunk_length_ms: int = CHUNK_DURATION_MINUTES * 60 * 1000,
+    overlap_ms: int = CHUNK_OVERLAP_MS,
+) -> Iterator[np.ndarray]:
     """
-    Split an audio file into chunks of specified length.
+    Split an audio file into overlapping chunks of specified length.
+    The file is decoded with PyAV and resampled to 16 kHz mono on the fly, and
+    each chunk is yielded as soon as it is decoded so callers can start
+    transcribing it while the rest of the file is still being decoded.
     Args:
         audio_path (str): Path to the audio file
-        chunk_length_ms (int): Length of each chunk in milliseconds (default: 10 minutes)
+        chunk_length_ms (int): Interval between chunk starts in milliseconds (default: 10 minutes)
+        overlap_ms (int): Extra audio included at the end of each chunk, so it
+            overlaps the start of the next one (default: 5 seconds)
+    Yields:
+        np.ndarray: Audio chunks as 16 kHz mono int16 samples, in order
+    Raises:
+        ValueError: If the file has no audio stream.
+    """
+    chunk_length = chunk_length_ms * SAMPLE_RATE // 1000
+    overlap = overlap_ms * SAMPLE_RATE // 1000
+    chunk_count = 0
+    resampler = av.AudioResampler(format="s16", layout="mono", rate=SAMPLE_RATE)
+    frames = []
+    buffered = 0
+
+    with av.open(audio_path) as container:
+        if not container.streams.audio:
+            raise ValueError(f"No audio stream found in file: {audio_path}")
+        stream = container.streams.audio[0]
+        for frame in container.decode(stream):
+            for resampled in resampler.resample(frame):
+                samples = resampled.to_ndarray()[0]
+                frames.append(samples)
+                buffered += len(samples)
+
+            while buffered >= chunk_length + overlap:
+                buffer = np.concatenate(frames)
+                yield buffer[: chunk_length + overlap]
+                chunk_count += 1
+                frames = [buffer[chunk_length:]]
+                buffered -= chunk_length
+
+        # Flush samples still held by the resampler
+        for resampled in resampler.resample(None):
+            frames.append(resampled.to_ndarray()[0])
+
+    # The remainder is shorter than a chunk plus its overlap; skip it when it
+    # only holds audio already covered by the previous chunk's overlap
+    remainder = np.concatenate(frames) if frames else np.empty(0, dtype=np.int16)
+    if len(remainder) > (overlap if chunk_count else 0):
+        yield remainder
+
+
+def strip_silence(chunk: np.ndarray) -> Tuple[np.ndarray, List[List[int]]]:
+    """
+    Remove long silences from an audio chunk.
+    Args:
+        chunk (np.ndarray): Audio chunk to compress, as 16 kHz mono int16 samples
+    Returns:
+        Tuple[np.ndarray, List[List[int]]]: The compressed chunk, where each
+            non-silent range is followed by a SILENCE_PADDING_MS gap, and the
+            [start, end] ranges (in ms) kept from the original chunk
+    """
+    segment = AudioSegment(
+        data=chunk.tobytes(), sample_width=2, frame_rate=SAMPLE_RATE, channels=1
+    )
+    kept_ranges = detect_nonsilent(
+        segment,
+        min_silence_len=MIN_SILENCE_LEN_MS,
+        silence_thresh=segment.dBFS - SILENCE_THRESHOLD_DB,
+        seek_step=SILENCE_SEEK_STEP_MS,
+    )
+    padding = np.zeros(SILENCE_PADDING_MS * SAMPLE_RATE // 1000, dtype=np.int16)
+
+    parts = []
+    for start, end in kept_ranges:
+        parts.append(chunk[start * SAMPLE_RATE // 1000 : end * SAMPLE_RATE // 1000])
+        parts.append(padding)
+    compressed = np.concatenate(parts) if parts else np.empty(0, dtype=np.int16)
+
+    return compressed, kept_ranges
+
+
+def encode_flac(samples: np.ndarray) -> bytes:
+    """
+    Encode 16 kHz mono int16 samples as FLAC in memory.
+    Args:
+        samples (np.ndarray): Audio samples to encode
+    Returns:
+        bytes: The encoded FLAC file
+    """
+    frame = av.AudioFrame.from_ndarray(
+        samples.reshape(1, -1), format="s16", layout="mono"
+    )
+    frame.sample_rate = SAMPLE_RATE
+
+    audio_buffer = io.BytesIO()
+    with av.open(audio_buffer, "w", format="flac") as container:
+        stream = container.add_stream("flac", rate=SAMPLE_RATE, layout="mono")
+        stream.format = "s16"
+        for packet in stream.encode(frame):
+            container.mux(packet)
+        for packet in stream.encode(None):
+            container.mux(packet)
+
+    return audio_buffer.getvalue()
+
+
+def restore_timestamps(chunks: List[Dict], kept_ranges: List[List[int]]) -> None:
+    """
+    Map timestamps of a silence-stripped chunk back to the original chunk.
+    Args:
+        chunks (List[Dict]): Transcribed segments, updated in place
+        kept_ranges (List[List[int]]): Ranges returned by strip_silence()
+    """
+    # Start of each kept range in the compressed audio, in seconds
+    compressed_starts = []
+    position = 0
+    for start, end in kept_ranges:
+        compressed_starts.append(position / 1000)
+        position += end - start + SILENCE_PADDING_MS
+
+    def to_original(timestamp: float) -> float:
+        index = max(bisect.bisect_right(compressed_starts, timestamp) - 1, 0)
+        start, end = kept_ranges[index]
+        # Timestamps falling in the padding are clamped to the end of the range
+        elapsed = min(timestamp - compressed_starts[index], (end - start) / 1000)
+        return start / 1000 + elapsed
+
+    for chunk_data in chunks:
+        chunk_data["timestamp"] = [
+            None if timestamp is None else to_original(timestamp)
+            for timestamp in chunk_data["timestamp"]
+        ]
+
+
+def load_cached_result(cache_key: str) -> Optional[Dict]:
+    """
+    Load a transcription result from the cache.
+    Entries not used for TRANSCRIPTION_CACHE_TTL seconds are expired.
+    Args:
+        cache_key (str): Hash of the uploaded audio and request parameters
+    Returns:
+        Optional[Dict]: The cached transcription result, or None on a miss
+    """
+    cache_dir = os.environ.get("TRANSCRIPTION_CACHE_DIR")
+    if not cache_dir:
+        return None
+
+    ttl = float(os.environ.get("TRANSCRIPTION_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS))
+    cache_path = os.path.join(cache_dir, f"{cache_key}.json")
+    try:
+        if time.time() - os.path.getmtime(cache_path) > ttl:
+            os.remove(cache_path)
+            return None
+        with open(cache_path, "rb") as cache_file:
+            result = orjson.loads(cache_file.read())
+        # Refresh the entry so least recently used ones are evicted first
+        os.utime(cache_path)
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+    return result
+
+
+def store_cached_result(cache_key: str, result: Dict) -> None:
+    """
+    Store a transcription result in the cache, evicting the least recently
+    used entries beyond TRANSCRIPTION_CACHE_MAX_ENTRIES.
+    Args:
+        cache_key (str): Hash of the uploaded audio and request parameters
+        result (Dict): Transcription result returned by the API
+    """
+    cache_dir = os.environ.get("TRANSCRIPTION_CACHE_DIR")
+    if not cache_dir:
+        return
+
+    max_entries = int(
+        os.environ.get("TRANSCRIPTION_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES)
+    )
+    cache_path = os.path.join(cache_dir, f"{cache_key}.json")
+
+    # Write to a temporary file first so concurrent readers never see a partial
+    # entry; failing to store a result is treated like a cache miss
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(orjson.dumps(result))
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        return
+
+    # Parallel workers may evict the same entries, so skip vanished files
+    entries = []
+    try:
+        for entry in os.scandir(cache_dir):
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                continue
+    except OSError:
+        return
+
+    if len(entries) > max_entries:
+        entries.sort()
+        for _, entry_path in entries[: len(entries) - max_entries]:
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+
+def post_transcription(url: str, files: Dict, data: Dict, headers: Dict) -> requests.Response:
+    """
+    Send a transcription request, gzip-encoding the multipart body when
+    CASSANDRE_GZIP_UPLOAD is enabled. Falls back to an uncompressed upload if
+    the API rejects the encoding with 415 Unsupported Media Type.
+    Args:
+        url (str): Transcription endpoint
+        files (Dict): Multipart files to upload
+        data (Dict): Multipart form fields
+        headers (Dict): Extra request headers
     Returns:
-        List[AudioSegment]: List of audio chunks
+        requests.Response: The API response
     """
-    audio = AudioSegment.from_file(audio_path)
-    chunks = []
+    global _gzip_upload_rejected
+
+    request = _session.prepare_request(
+        requests.Request("POST", url, files=files, data=data, headers=headers)
+    )
+    # Apply proxy and CA bundle settings from the environment, as Session.post does
+    settings = _session.merge_environment_settings(request.url, {}, None, None, None)
+    gzip_upload = os.environ.get("CASSANDRE_GZIP_UPLOAD", "").lower() in ("1", "true", "yes")
 
-    for i in range(0, len(audio), chunk_length_ms):
-        chunk = audio[i : i + chunk_length_ms]
-        chunks.append(chunk)
+    if gzip_upload and not _gzip_upload_rejected:
+        compressed_request = request.copy()
+        compressed_request.headers["Content-Encoding"] = "gzip"
+        compressed_request.prepare_body(gzip.compress(request.body), None)
+        response = _session.send(compressed_request, timeout=300000, **settings)
+        if response.status_code != 415:
+            return response
+        _gzip_upload_rejected = True
 
-    return chunks
+    return _session.send(request, timeout=300000, **settings)
 
 
-def transcribe_chunk(chunk: AudioSegment, previous_text: str = "") -> Dict:
+def transcribe_chunk(chunk: np.ndarray) -> Dict:
     """
     Transcribe a single audio chunk.
     Args:
-        chunk (AudioSegment): Audio chunk to transcribe
-        previous_text (str): Text from previous chunks to provide context
+        chunk (np.ndarray): Audio chunk to transcribe, as 16 kHz mono int16 samples
     Returns:
         dict: Transcription result
     """
@@ -64,89 +369,402 @@ def transcribe_chunk(chunk: AudioSegment, previous_text: str = "") -> Dict:
     api_key = os.environ.get("CASSANDRE_API_KEY")
     model = os.environ.get("WHISPER_MODEL")
 
-    # Export chunk to temporary file
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=True) as temp_file:
-        chunk.export(temp_file.name, format="mp3")
-        mime_type = get_mime_type(temp_file.name)
+    # Only upload the speech; timestamps are mapped back once transcribed
+    compressed, kept_ranges = strip_silence(chunk)
+    if not kept_ranges:
+        return {"text": "", "chunks": []}
+
+    audio_bytes = encode_flac(compressed)
+
+    # Chunks are transcribed in parallel, so the prompt carries no context
+    # from previous chunks
+    prompt = (
+        "Bonjour, Voici un fichier audio en français "
+        "que tu dois analyser. "
+    )
+
+    data = {
+        "model": model,
+        "language": "fr",
+        "prompt": prompt,
+        "response_format": "json", # can be json
+        "temperature": 0.2,
+        "timestamp_granularities[]": ["segment"],
+    }
+
+    # Identical audio sent with identical parameters gives the same result
+    cache_key = hashlib.sha256(
+        orjson.dumps(data, option=orjson.OPT_SORT_KEYS) + audio_bytes
+    ).hexdigest()
+    result = load_cached_result(cache_key)
 
-        # Create prompt with context from previous chunks
-        prompt = (
-            "Bonjour, Voici un fichier audio en français "
-            "que tu dois analyser. "
+    if result is None:
+        files = {"file": ("chunk.flac", io.BytesIO(audio_bytes), "audio/flac")}
+        response = post_transcription(
+            f"{base_url}/audio/transcriptions",
+            files=files,
+            data=data,
+            headers={"Authorization": f"Bearer {api_key}"},
         )
-        if previous_text:
-            prompt += f"Contexte précédent: {previous_text[-500:]}"  # Last 500 chars of context
-
-        with open(temp_file.name, "rb") as audio_file:
-            files = {"file": (temp_file.name, audio_file, mime_type)}
-            data = {
-                "model": model,
-                "language": "fr",
-                "prompt": prompt,
-                "response_format": "json", # can be json
-                "temperature": 0.2,
-                "timestamp_granularities[]": ["segment"],
-            }
 
-            response = requests.post(
-                f"{base_url}/audio/transcriptions",
-                files=files,
-                data=data,
-                headers={"Authorization": f"Bearer {api_key}"},
-                timeout=300000,
+        if response.status_code != 200:
+            raise requests.exceptions.RequestException(
+                f"Failed to transcribe audio chunk: {response.status_code} - {response.text}"
             )
 
-            if response.status_code != 200:
-                raise requests.exceptions.RequestException(
-                    f"Failed to transcribe audio chunk: {response.status_code} - {response.text}"
-                )
+        try:
+            result = orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            raise requests.exceptions.RequestException(
+                f"Invalid transcription response: {response.text}"
+            ) from exc
+        store_cached_result(cache_key, result)
+
+    restore_timestamps(result["chunks"], kept_ranges)
+
+    return result
+
+
+def shift_segments(chunks: List[Dict], time_offset: float) -> List[Dict]:
+    """
+    Shift the timestamps of a chunk's segments in a single vectorized pass.
+    Args:
+        chunks (List[Dict]): Transcribed segments of one chunk
+        time_offset (float): Offset in seconds to add to every timestamp
+    Returns:
+        List[Dict]: Copies of the segments with shifted timestamps; the chunk
+            result is left untouched
+    """
+    if not chunks:
+        return []
+
+    # Missing timestamps become NaN during the shift and None again afterwards
+    timestamps = np.array(
+        [chunk_data["timestamp"] for chunk_data in chunks], dtype=np.float64
+    )
+    timestamps += time_offset
+    shifted = np.where(np.isnan(timestamps), None, timestamps).tolist()
+
+    return [
+        {**chunk_data, "timestamp": timestamp}
+        for chunk_data, timestamp in zip(chunks, shifted)
+    ]
+
+
+def segment_end(chunk_data: Dict) -> float:
+    """
+    Get the end of a segment, falling back to its start when it is missing.
+    """
+    start, end = chunk_data["timestamp"]
+    return start if end is None else end
+
+
+def overlap_tail_start(segments: List[Dict], overlap_start: float) -> int:
+    """
+    Find where the trailing segments reaching into an overlap begin.
+    Args:
+        segments (List[Dict]): Segments of the merged timeline, in order
+        overlap_start (float): Start of the overlap with the next chunk, in seconds
+    Returns:
+        int: Index of the first segment ending after overlap_start, such that
+            every following segment also does
+    """
+    index = len(segments)
+    while index > 0 and segment_end(segments[index - 1]) > overlap_start:
+        index -= 1
+    return index
+
+
+def find_overlap_match(
+    tail: List[Dict], head: List[Dict]
+) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Align the words spoken in the overlap of two consecutive chunks.
+    Args:
+        tail (List[Dict]): Segments of the first chunk reaching into the overlap
+        head (List[Dict]): Segments of the second chunk starting in the overlap
+    Returns:
+        Optional[Tuple[int, int, int, int]]: Segment and word indices in tail,
+            then in head, where the longest run of words common to both chunks
+            starts, or None when no words match between overlapping segments
+    """
+    tail_words = [
+        (segment_index, word_index, re.sub(r"\W+", "", word.lower()))
+        for segment_index, chunk_data in enumerate(tail)
+        for word_index, word in enumerate(chunk_data["text"].split())
+    ]
+    head_words = [
+        (segment_index, word_index, re.sub(r"\W+", "", word.lower()))
+        for segment_index, chunk_data in enumerate(head)
+        for word_index, word in enumerate(chunk_data["text"].split())
+    ]
+    # Words made only of punctuation never match
+    matcher = SequenceMatcher(
+        None,
+        [word or f"\0tail{index}" for index, (_, _, word) in enumerate(tail_words)],
+        [word or f"\0head{index}" for index, (_, _, word) in enumerate(head_words)],
+        autojunk=False,
+    )
+
+    best_match = None
+    best_size = 0
+    for block in matcher.get_matching_blocks():
+        if block.size <= best_size:
+            continue
+        tail_segment, tail_word, _ = tail_words[block.a]
+        head_segment, head_word, _ = head_words[block.b]
+        # Only trust matches heard at about the same time by both chunks
+        tail_start = tail[tail_segment]["timestamp"][0]
+        head_start = head[head_segment]["timestamp"][0]
+        if (
+            tail_start > segment_end(head[head_segment]) + OVERLAP_MATCH_TOLERANCE_SECONDS
+            or head_start > segment_end(tail[tail_segment]) + OVERLAP_MATCH_TOLERANCE_SECONDS
+        ):
+            continue
+        best_match = (tail_segment, tail_word, head_segment, head_word)
+        best_size = block.size
 
-            return response.json()
+    return best_match
 
 
-def transcript(audio_file_path: str) -> Dict:
+def stitch_segments(
+    merged: List[Dict], segments: List[Dict], overlap_start: float, overlap_end: float
+) -> None:
+    """
+    Append the segments of the next chunk to the merged timeline, keeping the
+    speech heard by both chunks in their overlap only once.
+    The words of the segments around the overlap are aligned, and the timeline
+    switches from the previous chunk to the next one where they start to agree.
+    When no words match, it switches at the first segment of the previous chunk
+    starting after the middle of the overlap.
+    Args:
+        merged (List[Dict]): Segments of the merged timeline, updated in place
+        segments (List[Dict]): Segments of the next chunk, with shifted timestamps
+        overlap_start (float): Start of the overlap between the chunks, in seconds
+        overlap_end (float): End of the overlap between the chunks, in seconds
+    """
+    tail_start = overlap_tail_start(merged, overlap_start)
+    tail = merged[tail_start:]
+    head_end = 0
+    while head_end < len(segments) and segments[head_end]["timestamp"][0] < overlap_end:
+        head_end += 1
+    head = segments[:head_end]
+
+    match = find_overlap_match(tail, head)
+    if match is not None:
+        tail_segment, tail_word, head_segment, head_word = match
+        kept_tail = tail[:tail_segment]
+        kept_head = head[head_segment:]
+
+        # Keep the words of the previous chunk spoken before the match
+        cut = tail[tail_segment]
+        cut_words = cut["text"].split()[:tail_word]
+        if cut_words:
+            start = cut["timestamp"][0]
+            end = max(start, min(segment_end(cut), kept_head[0]["timestamp"][0]))
+            kept_tail.append({**cut, "text": " ".join(cut_words), "timestamp": [start, end]})
+
+        # And the words of the next chunk from the match onwards
+        if head_word:
+            cut = kept_head[0]
+            start = cut["timestamp"][0]
+            if kept_tail:
+                start = min(max(start, segment_end(kept_tail[-1])), segment_end(cut))
+            kept_head[0] = {
+                **cut,
+                "text": " ".join(cut["text"].split()[head_word:]),
+                "timestamp": [start, cut["timestamp"][1]],
+            }
+    else:
+        middle = (overlap_start + overlap_end) / 2
+        kept_tail = [
+            chunk_data for chunk_data in tail if chunk_data["timestamp"][0] < middle
+        ]
+        last_end = segment_end(kept_tail[-1]) if kept_tail else overlap_start
+        kept_head = [
+            chunk_data for chunk_data in head if segment_end(chunk_data) > last_end
+        ]
+
+    merged[tail_start:] = kept_tail + kept_head + segments[head_end:]
+
+
+def append_chunk_segments(merged: List[Dict], chunk_result: Dict, index: int) -> None:
+    """
+    Append the segments of a chunk to the merged timeline.
+    Args:
+        merged (List[Dict]): Segments of the merged timeline, updated in place
+        chunk_result (Dict): Transcription result of the chunk
+        index (int): Position of the chunk in the audio
+    """
+    chunk_seconds = CHUNK_DURATION_MINUTES * 60  # 10 minutes in seconds
+
+    # Adjust timestamps for chunks based on chunk position
+    segments = shift_segments(chunk_result["chunks"], index * chunk_seconds)
+    if index == 0:
+        merged.extend(segments)
+    else:
+        overlap_start = index * chunk_seconds
+        stitch_segments(
+            merged, segments, overlap_start, overlap_start + CHUNK_OVERLAP_MS / 1000
+        )
+
+
+def merge_chunk_segments(chunk_results: List[Dict]) -> List[Dict]:
+    """
+    Merge the segments of consecutive overlapping chunks into a single timeline.
+    Args:
+        chunk_results (List[Dict]): Transcription results of the chunks, in order
+    Returns:
+        List[Dict]: Copies of the kept segments, with timestamps relative to
+            the whole audio
+    """
+    merged: List[Dict] = []
+    for index, chunk_result in enumerate(chunk_results):
+        append_chunk_segments(merged, chunk_result, index)
+
+    return merged
+
+
+def settle_segments(
+    merged: List[Dict], settled_count: int, new_settled_count: int, text_parts: List[str]
+) -> Dict:
+    """
+    Build a transcription result from the settled start of the merged timeline.
+    Args:
+        merged (List[Dict]): Segments of the merged timeline
+        settled_count (int): Number of segments already settled
+        new_settled_count (int): Number of segments settled from now on
+        text_parts (List[str]): Texts of the settled segments, extended in place
+    Returns:
+        dict: The transcription result covering the settled segments.
+    """
+    # Only the newly settled segments are added rather than rebuilding the text
+    text_parts.extend(
+        part
+        for part in (
+            chunk_data["text"].strip()
+            for chunk_data in merged[settled_count:new_settled_count]
+        )
+        if part
+    )
+
+    return {
+        "text": " ".join(text_parts),
+        "chunks": merged[:new_settled_count],
+        "language": "fr",
+    }
+
+
+def combine_chunk_results(chunk_results: List[Dict]) -> Dict:
+    """
+    Combine the transcription results of consecutive chunks.
+    Args:
+        chunk_results (List[Dict]): Transcription results of the chunks, in order
+    Returns:
+        dict: The combined transcription result as a dictionary.
+    """
+    merged = merge_chunk_segments(chunk_results)
+    return settle_segments(merged, 0, len(merged), [])
+
+
+def transcript(audio_file_path: str) -> Iterator[Dict]:
     """
     Transcribes a long audio file by splitting it into chunks and transcribing each chunk.
+    A partial result is yielded whenever the chunks transcribed so far form a
+    longer run from the start of the audio, so callers can show text before
+    the whole file is done. Partial results leave out the speech in the
+    overlap with the next chunk until it is merged, so text already yielded
+    never changes; the last yielded result covers the whole file.
     Args:
         audio_file_path (str): The path to the audio file to be transcribed.
-    Returns:
+    Yields:
         dict: The combined transcription result as a dictionary.
     Raises:
         FileNotFoundError: If the audio file does not exist.
         PermissionError: If the audio file cannot be accessed due to permissions.
         IOError: If there's an error reading the audio file.
+        ValueError: If the file has no audio stream or cannot be decoded.
         requests.exceptions.RequestException: If the transcription request fails.
     """
     try:
-        # Validate file exists and has valid mime type
-        get_mime_type(audio_file_path)
+        # Fail fast on a missing file; unsupported formats are reported by the decoder
+        os.stat(audio_file_path)
 
-        # Split audio into chunks
-        chunks = split_audio(audio_file_path)
+        # Transcribe chunks in parallel as soon as they are decoded; each chunk
+        # is an independent API call, boundary context comes from the overlap
+        # between chunks rather than from a previous-text prompt
+        max_workers = int(
+            os.environ.get(
+                "TRANSCRIBE_CONCURRENCY", DEFAULT_TRANSCRIBE_CONCURRENCY
+            )
+        )
+        print(f"Processing chunks ({max_workers} in parallel)...")
+        chunk_seconds = CHUNK_DURATION_MINUTES * 60  # 10 minutes in seconds
+        chunk_results: Dict[int, Dict] = {}
+        pending = {}
+        decoded_all = False
+        final_yielded = False
 
-        # Initialize results
-        combined_result = {"text": "", "chunks": [], "language": "fr"}
-        previous_text = ""
+        # Chunks are merged into the timeline as soon as they are available in
+        # order; segments before settled_count will not change anymore
+        merged: List[Dict] = []
+        merged_count = 0
+        settled_count = 0
+        text_parts: List[str] = []
 
-        # Process each chunk
-        for i, chunk in enumerate(chunks):
-            print(f"Processing chunk {i+1}/{len(chunks)}...")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunks = enumerate(split_audio(audio_file_path))
+            try:
+                while True:
+                    if len(pending) >= 2 * max_workers:
+                        # Decoding is ahead of the uploads, wait for a chunk to
+                        # finish rather than holding more decoded audio in memory
+                        finished = [next(as_completed(pending))]
+                    elif not decoded_all and (chunk_entry := next(chunks, None)) is not None:
+                        index, chunk = chunk_entry
+                        pending[executor.submit(transcribe_chunk, chunk)] = index
+                        finished = [future for future in pending if future.done()]
+                    else:
+                        decoded_all = True
+                        if not pending:
+                            break
+                        # Everything is decoded, wait for the next chunk to finish
+                        finished = [next(as_completed(pending))]
 
-            # Transcribe chunk with context from previous chunks
-            chunk_result = transcribe_chunk(chunk, previous_text)
+                    for future in finished:
+                        chunk_results[pending.pop(future)] = future.result()
 
-            # Adjust timestamps for chunks based on chunk position
-            time_offset = i * (CHUNK_DURATION_MINUTES * 60)  # 10 minutes in seconds
-            for chunk_data in chunk_result["chunks"]:
-                chunk_data["timestamp"][0] += time_offset
-                chunk_data["timestamp"][1] += time_offset
-                combined_result["chunks"].append(chunk_data)
+                    # Merge the chunks now available in order
+                    if merged_count not in chunk_results:
+                        continue
+                    while merged_count in chunk_results:
+                        append_chunk_segments(
+                            merged, chunk_results.pop(merged_count), merged_count
+                        )
+                        merged_count += 1
+                    print(f"Transcribed chunks 1-{merged_count}")
 
-            # Update combined text and context for next chunk
-            combined_result["text"] += " " + chunk_result["text"].strip()
-            previous_text = combined_result["text"]
+                    # Until the last chunk is merged, hold back the segments
+                    # reaching into the overlap with the next chunk
+                    final_yielded = decoded_all and not pending
+                    if final_yielded:
+                        new_settled_count = len(merged)
+                    else:
+                        new_settled_count = overlap_tail_start(
+                            merged, merged_count * chunk_seconds
+                        )
+                    yield settle_segments(
+                        merged, settled_count, new_settled_count, text_parts
+                    )
+                    settled_count = new_settled_count
+            except BaseException:
+                # Do not upload queued chunks once the transcription failed or
+                # the caller stopped consuming results
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
-        return combined_result
+        if not final_yielded:
+            yield settle_segments(merged, settled_count, len(merged), text_parts)
 
     except FileNotFoundError as exc:
         raise FileNotFoundError(f"Audio file not found: {audio_file_path}") from exc